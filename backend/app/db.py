@@ -20,7 +20,18 @@ def get_database_url() -> str:
     return database_url
 
 
-engine = create_engine(get_database_url(), future=True)
+# Pool sized for concurrent request handlers; pre-ping and recycle keep
+# stale connections from surfacing as request errors, and LIFO checkout
+# keeps the most recently used (warmest) connections busy
+engine = create_engine(
+    get_database_url(),
+    future=True,
+    pool_size=20,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
 
@@ -3,6 +3,7 @@ Gemini AI Integration for Email Analysis
 Uses Google's Gemini AI to intelligently parse job application emails.
 """
 
+import logging
 import os
 import re
 from datetime import datetime, date, timedelta
@@ -12,6 +13,8 @@ from .db import SessionLocal
 from .models import JobApplication
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
@@ -24,6 +27,16 @@ if GEMINI_API_KEY:
 MODEL_NAME = "gemini-1.5-flash"  # Free tier model
 MAX_TOKENS_PER_REQUEST = 1000  # Conservative limit for free tier
 
+# Threading indicators checked against already-lowercased text, so the
+# fused pattern is compiled once and without IGNORECASE
+_THREADING_RE = re.compile(
+    r're:\s*'       # Re: subject
+    r'|fw:\s*'      # Fwd: subject
+    r'|fwd:\s*'     # Forward subject
+    r'|\[thread\]'  # Thread indicators
+    r'|conversation'  # Conversation references
+)
+
 class GeminiEmailAnalyzer:
     """
     Analyzes job application emails using Gemini AI API.
@@ -39,12 +52,12 @@ class GeminiEmailAnalyzer:
             try:
                 self.model = genai.GenerativeModel(MODEL_NAME)
                 self.is_available = True
-                print("✅ Gemini API initialized successfully")
+                logger.info("✅ Gemini API initialized successfully")
             except Exception as e:
-                print(f"❌ Failed to initialize Gemini API: {e}")
+                logger.error("❌ Failed to initialize Gemini API: %s", e)
                 self.is_available = False
         else:
-            print("⚠️  GEMINI_API_KEY not found in environment variables")
+            logger.warning("⚠️  GEMINI_API_KEY not found in environment variables")
             self.is_available = False
     
     def is_email_recent(self, email_date: str, days_threshold: int = 7) -> bool:
@@ -62,7 +75,7 @@ class GeminiEmailAnalyzer:
             # Parse email date
             parsed_date = self._parse_email_date(email_date)
             if not parsed_date:
-                print(f"⚠️  Could not parse email date: {email_date}")
+                logger.warning("⚠️  Could not parse email date: %s", email_date)
                 return True  # If we can't parse the date, assume it's recent enough
             
             # Calculate threshold date (make it timezone-aware)
@@ -76,14 +89,14 @@ class GeminiEmailAnalyzer:
             is_recent = parsed_date >= threshold_date
             
             if not is_recent:
-                print(f"📧 Email from {parsed_date.strftime('%Y-%m-%d')} is older than {days_threshold} days, skipping AI analysis")
+                logger.debug("📧 Email from %s is older than %d days, skipping AI analysis", parsed_date.strftime('%Y-%m-%d'), days_threshold)
             else:
-                print(f"📧 Email from {parsed_date.strftime('%Y-%m-%d')} is within {days_threshold} days, proceeding with analysis")
+                logger.debug("📧 Email from %s is within %d days, proceeding with analysis", parsed_date.strftime('%Y-%m-%d'), days_threshold)
             
             return is_recent
             
         except Exception as e:
-            print(f"Error checking email date: {e}")
+            logger.error("Error checking email date: %s", e)
             return True  # If there's an error, assume it's recent enough to analyze
     
     def _parse_email_date(self, email_date: str) -> Optional[datetime]:
@@ -108,7 +121,7 @@ class GeminiEmailAnalyzer:
             return None
             
         except Exception as e:
-            print(f"Error parsing date '{email_date}': {e}")
+            logger.error("Error parsing date '%s': %s", email_date, e)
             return None
     
     def estimate_token_count(self, text: str) -> int:
@@ -140,18 +153,10 @@ class GeminiEmailAnalyzer:
             if indicator in text:
                 return True
         
-        # Check for email threading indicators
-        threading_patterns = [
-            r're:\s*',  # Re: subject
-            r'fw:\s*',  # Fwd: subject
-            r'fwd:\s*',  # Forward subject
-            r'\[thread\]',  # Thread indicators
-            r'conversation',  # Conversation references
-        ]
-        
-        for pattern in threading_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
+        # Check for email threading indicators; text is lowercased
+        # above, so no IGNORECASE needed
+        if _THREADING_RE.search(text):
+            return True
         
         # Check for very short subjects that often indicate follow-ups
         if len(subject.strip()) < 25 and any(word in text for word in ['reminder', 'update', 'next', 'schedule']):
@@ -191,7 +196,7 @@ class GeminiEmailAnalyzer:
                 max_body_length = 1500  # Conservative estimate
                 body = body[:max_body_length] + "..."
                 prompt = self._create_analysis_prompt(subject, body, from_email)
-                print(f"⚠️  Truncated email body to fit token limit (estimated: {estimated_tokens})")
+                logger.debug("⚠️  Truncated email body to fit token limit (estimated: %d)", estimated_tokens)
             
             # Generate content using Gemini
             response = self.model.generate_content(prompt)
@@ -212,14 +217,14 @@ class GeminiEmailAnalyzer:
                     return parsed_result
             
             # Fallback to regex parsing if Gemini fails
-            print("⚠️  Gemini analysis failed, falling back to regex parsing")
+            logger.warning("⚠️  Gemini analysis failed, falling back to regex parsing")
             fallback_result = self._fallback_analysis(subject, body, from_email)
             if fallback_result:
                 fallback_result['is_follow_up'] = is_follow_up
             return fallback_result
             
         except Exception as e:
-            print(f"Error in Gemini analysis: {e}")
+            logger.error("Error in Gemini analysis: %s", e)
             # Fallback to regex parsing
             fallback_result = self._fallback_analysis(subject, body, from_email)
             if fallback_result:
@@ -297,7 +302,7 @@ Analyze this email and provide your response in the exact JSON format above.
             # Extract JSON from response
             json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
             if not json_match:
-                print(f"❌ No JSON found in Gemini response: {response_text[:100]}...")
+                logger.warning("❌ No JSON found in Gemini response: %s...", response_text[:100])
                 return None
             
             json_str = json_match.group(0)
@@ -309,7 +314,7 @@ Analyze this email and provide your response in the exact JSON format above.
             # Validate required fields
             required_fields = ['is_job_email', 'company', 'title', 'status', 'confidence']
             if not all(field in data for field in required_fields):
-                print(f"❌ Missing required fields in Gemini response: {data}")
+                logger.warning("❌ Missing required fields in Gemini response: %s", data)
                 return None
             
             # Clean and validate data
@@ -326,7 +331,7 @@ Analyze this email and provide your response in the exact JSON format above.
             return cleaned_data
             
         except Exception as e:
-            print(f"❌ Error parsing Gemini response: {e}")
+            logger.error("❌ Error parsing Gemini response: %s", e)
             return None
     
     def _clean_company_name(self, company: str) -> Optional[str]:
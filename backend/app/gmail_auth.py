@@ -1,17 +1,22 @@
 """
 Gmail OAuth2 Authentication Module
 """
+import logging
 import os
 import json
 from pathlib import Path
 from typing import Optional
 
+import google_auth_httplib2
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+logger = logging.getLogger(__name__)
+
 
 # Gmail API scopes needed for reading emails
 SCOPES = [
@@ -41,14 +46,14 @@ def get_gmail_service() -> Optional[object]:
             try:
                 creds.refresh(Request())
             except Exception as e:
-                print(f"Error refreshing token: {e}")
+                logger.error("Error refreshing token: %s", e)
                 creds = None
         
         if not creds:
             if not CREDENTIALS_FILE.exists():
-                print(f"Credentials file not found at {CREDENTIALS_FILE}")
-                print("Please download credentials.json from Google Cloud Console")
-                print("and place it in the backend/ directory")
+                logger.error("Credentials file not found at %s", CREDENTIALS_FILE)
+                logger.error("Please download credentials.json from Google Cloud Console")
+                logger.error("and place it in the backend/ directory")
                 return None
             
             try:
@@ -63,15 +68,18 @@ def get_gmail_service() -> Optional[object]:
                     token.write(creds.to_json())
                     
             except Exception as e:
-                print(f"Error during OAuth flow: {e}")
-                print("Try running authentication locally instead of in Docker")
+                logger.error("Error during OAuth flow: %s", e)
+                logger.error("Try running authentication locally instead of in Docker")
                 return None
     
     try:
-        service = build('gmail', 'v1', credentials=creds)
+        # Build over an explicit AuthorizedHttp so keep-alive TCP/TLS
+        # connections are reused across API calls on this service
+        authorized_http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http())
+        service = build('gmail', 'v1', http=authorized_http)
         return service
     except HttpError as error:
-        print(f"Error building Gmail service: {error}")
+        logger.error("Error building Gmail service: %s", error)
         return None
 
 
@@ -86,16 +94,17 @@ def test_gmail_connection() -> bool:
     
     try:
         profile = service.users().getProfile(userId='me').execute()
-        print(f"Connected to Gmail as: {profile['emailAddress']}")
+        logger.info("Connected to Gmail as: %s", profile['emailAddress'])
         return True
     except HttpError as error:
-        print(f"Error testing Gmail connection: {error}")
+        logger.error("Error testing Gmail connection: %s", error)
         return False
 
 
 if __name__ == "__main__":
     # Test authentication when run directly
+    logging.basicConfig(level=logging.INFO)
     if test_gmail_connection():
-        print("Gmail authentication successful!")
+        logger.info("Gmail authentication successful!")
     else:
-        print("Gmail authentication failed!")
+        logger.error("Gmail authentication failed!")
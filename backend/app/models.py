@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import date
 
-from sqlalchemy import Date, Integer, String, Enum
+from sqlalchemy import Date, Index, Integer, String, Enum, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 import enum
 
@@ -22,6 +22,13 @@ class ApplicationStatus(enum.Enum):
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
+    __table_args__ = (
+        # Lets inserts dedup exact repeats in the database via ON CONFLICT
+        UniqueConstraint("title", "company", "date_applied", name="uq_job_app_title_company_date"),
+        # Serves the duplicate-detection prefetch (company IN (...)) without
+        # a sequential scan as the table grows
+        Index("ix_jobapp_company_date", "company", "date_applied"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)